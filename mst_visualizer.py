@@ -2,25 +2,51 @@ import sys
 import threading
 import tkinter as tk
 from tkinter import simpledialog, messagebox
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Callable, Dict, List, Tuple, Optional
 import heapq
+from functools import partial
+from array import array
+from operator import itemgetter
 
 
 VertexId = int
 Edge = Tuple[VertexId, VertexId, float]
+# Trace event codes; small ints index the playback handler tables
+VISIT = 0
+CONSIDER = 1
+REJECT = 2
+ACCEPT = 3
+
+# (event code, data, canvas item to recolor)
+Step = Tuple[int, Tuple, int]
+StepHandler = Callable[[Tuple, int], int]
+
+
+def _edge_key(u: VertexId, v: VertexId) -> Tuple[VertexId, VertexId]:
+	# Undirected edge key with the smaller id first
+	return (u, v) if u < v else (v, u)
 
 
 class DisjointSet:
 	def __init__(self, n: int) -> None:
-		self.parent = list(range(n))
-		self.rank = [0] * n
+		# Packed int32/int8 storage; rank never exceeds log2(n)
+		self.parent = array("i", range(n))
+		self.rank = array("b", bytes(n))
 
 	def find(self, x: int) -> int:
-		if self.parent[x] != x:
-			self.parent[x] = self.find(self.parent[x])
-		return self.parent[x]
+		parent = self.parent
+		root = x
+		while parent[root] != root:
+			root = parent[root]
+		# Second pass: point every node on the path directly at the root
+		while parent[x] != root:
+			parent[x], x = root, parent[x]
+		return root
 
 	def union(self, x: int, y: int) -> bool:
+		# Sharing a parent already means sharing a root; skip both finds
+		if self.parent[x] == self.parent[y]:
+			return False
 		rx = self.find(x)
 		ry = self.find(y)
 		if rx == ry:
@@ -35,6 +61,181 @@ class DisjointSet:
 		return True
 
 
+def build_csr(n: int, edges: List[Edge]) -> Tuple[List[int], List[int], List[float]]:
+	"""Flatten an undirected edge list into CSR arrays.
+
+	Neighbors of vertex u are indices[indptr[u]:indptr[u + 1]], with the
+	matching edge weights at the same positions in weights.
+
+	The arrays are plain lists: an array.array read boxes a fresh int or
+	float on every access, which made the Prim inner loop slower.
+	"""
+	indptr = [0] * (n + 1)
+	for (u, v, _) in edges:
+		indptr[u + 1] += 1
+		indptr[v + 1] += 1
+	for i in range(n):
+		indptr[i + 1] += indptr[i]
+
+	indices = [0] * indptr[n]
+	weights = [0.0] * indptr[n]
+	fill = indptr[:-1]
+	for (u, v, w) in edges:
+		k = fill[u]
+		indices[k] = v
+		weights[k] = w
+		fill[u] = k + 1
+		k = fill[v]
+		indices[k] = u
+		weights[k] = w
+		fill[v] = k + 1
+	return indptr, indices, weights
+
+
+def kruskal_core(n: int, sorted_edges: List[Edge]) -> Tuple[List[bool], float]:
+	"""Run Kruskal over edges already sorted by weight.
+
+	Returns a mask parallel to sorted_edges marking the edges kept in the
+	MST, and their total weight. The disjoint-set operations are inlined
+	over local lists so the loop pays no method-call overhead per edge.
+	"""
+	parent = list(range(n))
+	rank = [0] * n
+	keep = [False] * len(sorted_edges)
+	total_weight: float = 0.0
+	for i, (u, v, w) in enumerate(sorted_edges):
+		if parent[u] == parent[v]:
+			continue
+		ru = u
+		while parent[ru] != ru:
+			ru = parent[ru]
+		while parent[u] != ru:
+			parent[u], u = ru, parent[u]
+		rv = v
+		while parent[rv] != rv:
+			rv = parent[rv]
+		while parent[v] != rv:
+			parent[v], v = rv, parent[v]
+		if ru == rv:
+			continue
+		if rank[ru] < rank[rv]:
+			parent[ru] = rv
+		elif rank[ru] > rank[rv]:
+			parent[rv] = ru
+		else:
+			parent[rv] = ru
+			rank[ru] += 1
+		keep[i] = True
+		total_weight += w
+	return keep, total_weight
+
+
+class BucketQueue:
+	"""Priority queue for small non-negative integer keys.
+
+	Items are (key, u, v) tuples filed into one bucket per key; pop scans
+	upward from the lowest possibly non-empty bucket.
+	"""
+
+	def __init__(self, max_key: int) -> None:
+		self.buckets: List[List[Tuple[float, int, int]]] = [[] for _ in range(max_key + 1)]
+		self.lowest = max_key + 1
+		self.size = 0
+
+	def __len__(self) -> int:
+		return self.size
+
+	def push(self, item: Tuple[float, int, int]) -> None:
+		key = int(item[0])
+		self.buckets[key].append(item)
+		if key < self.lowest:
+			self.lowest = key
+		self.size += 1
+
+	def pop(self) -> Tuple[float, int, int]:
+		if not self.size:
+			raise IndexError("pop from empty BucketQueue")
+		buckets = self.buckets
+		key = self.lowest
+		while not buckets[key]:
+			key += 1
+		self.lowest = key
+		self.size -= 1
+		return buckets[key].pop()
+
+
+BUCKET_QUEUE_MAX_KEY = 1024
+
+
+def fits_bucket_queue(weights: List[float]) -> bool:
+	# One bucket per key and pop may rescan every empty one, so the key
+	# range must stay small next to the number of queue entries (one per
+	# CSR slot). Negative or NaN keys would index the wrong bucket.
+	limit = min(len(weights), BUCKET_QUEUE_MAX_KEY)
+	return all(0 <= w <= limit and w == int(w) for w in weights)
+
+
+def prim_trace(
+	n: int,
+	edges: List[Edge],
+	start: VertexId,
+	use_bucket_pq: bool = False,
+) -> Tuple[List[Tuple[int, Tuple]], float]:
+	"""Run Prim from start and record its events for later playback.
+
+	Returns the ordered (VISIT | CONSIDER | REJECT | ACCEPT, data) events
+	and the total weight of the tree reached from start. With
+	use_bucket_pq, a BucketQueue replaces the binary heap when every weight
+	is a non-negative integer no larger than the number of CSR slots (and
+	BUCKET_QUEUE_MAX_KEY); otherwise heapq is used.
+	"""
+	indptr, indices, weights = build_csr(n, edges)
+
+	# Vertex ids are 0..n-1, so a byte per vertex replaces set hashing
+	visited = bytearray(n)
+	visited_count = 0
+
+	seed = [(weights[k], start, indices[k]) for k in range(indptr[start], indptr[start + 1])]
+	if use_bucket_pq and fits_bucket_queue(weights):
+		queue = BucketQueue(int(max(weights, default=0.0)))
+		push, pop = queue.push, queue.pop
+		for item in seed:
+			push(item)
+	else:
+		# Seed the heap with all of start's edges in one O(k) heapify
+		queue = seed
+		heapq.heapify(queue)
+		push, pop = partial(heapq.heappush, queue), partial(heapq.heappop, queue)
+
+	def push_edges(u: int) -> None:
+		for k in range(indptr[u], indptr[u + 1]):
+			v = indices[k]
+			if not visited[v]:
+				push((weights[k], u, v))
+
+	order: List[Tuple[int, Tuple]] = []
+	total_weight: float = 0.0
+	# Start from start vertex
+	order.append((VISIT, (start,)))
+	visited[start] = 1
+	visited_count += 1
+	while queue and visited_count < n:
+		w, u, v = pop()
+		edge = (u, v, w)
+		order.append((CONSIDER, edge))
+		if visited[v]:
+			# Stale entry: v was reached through a cheaper edge after this push
+			order.append((REJECT, edge))
+			continue
+		order.append((ACCEPT, edge))
+		total_weight += w
+		visited[v] = 1
+		visited_count += 1
+		order.append((VISIT, (v,)))
+		push_edges(v)
+	return order, total_weight
+
+
 class MSTVisualizer:
 	RADIUS = 16
 	COLOR_BG = "#111927"
@@ -46,6 +247,11 @@ class MSTVisualizer:
 	COLOR_EDGE_REJECT = "#ef4444"  # red
 	COLOR_EDGE_MST = "#10b981"  # green
 	COLOR_TEXT = "#e5e7eb"
+	# Canvas tags so whole groups can be recolored in a single Tk call
+	TAG_VERTEX = "vertex"
+	TAG_EDGE = "edge"
+	TAG_MST = "mst_final"
+	GRID_CELL = 2 * RADIUS
 
 	def __init__(self, root: tk.Tk, total_vertices: int) -> None:
 		self.root = root
@@ -93,6 +299,8 @@ class MSTVisualizer:
 		self.edges: List[Edge] = []
 		self.edge_items: Dict[Tuple[VertexId, VertexId], Tuple[int, int]] = {}  # line_id, text_id
 		self.vertex_click_buffer: List[VertexId] = []
+		# Spatial hash of vertex ids keyed by (x // GRID_CELL, y // GRID_CELL)
+		self.grid: Dict[Tuple[int, int], List[VertexId]] = {}
 
 		self.placing_vertices_remaining = self.total_vertices
 		self.is_animating = False
@@ -100,6 +308,13 @@ class MSTVisualizer:
 		self.kruskal_total_weight: Optional[float] = None
 		self.prim_total_weight: Optional[float] = None
 
+		# Playback state for play_steps/_tick
+		self._steps: List[Step] = []
+		self._step_idx = 0
+		self._running_total: float = 0.0
+		self._handlers: List[Optional[StepHandler]] = []
+		self._finalize: Optional[Callable[[], None]] = None
+
 		self.canvas.bind("<Button-1>", self.on_canvas_click)
 
 	def on_canvas_click(self, event: tk.Event) -> None:
@@ -126,7 +341,7 @@ class MSTVisualizer:
 			if u == v:
 				return
 			# Normalize edge key
-			key = (min(u, v), max(u, v))
+			key = _edge_key(u, v)
 			if key in self.edge_items:
 				messagebox.showinfo("Edge exists", "Edge already exists between selected vertices.")
 				return
@@ -145,10 +360,13 @@ class MSTVisualizer:
 			fill=self.COLOR_NODE_IDLE,
 			outline="#1f2937",
 			width=2,
+			tags=(self.TAG_VERTEX,),
 		)
 		label = self.canvas.create_text(x, y, text=str(vid), fill=self.COLOR_TEXT, font=("Segoe UI", 10, "bold"))
 		self.vertex_positions[vid] = (x, y)
 		self.vertex_items[vid] = (oval, label)
+		cell = (int(x // self.GRID_CELL), int(y // self.GRID_CELL))
+		self.grid.setdefault(cell, []).append(vid)
 
 	def prompt_weight(self, u: VertexId, v: VertexId) -> Optional[float]:
 		try:
@@ -167,24 +385,28 @@ class MSTVisualizer:
 	def add_edge(self, u: VertexId, v: VertexId, w: float) -> None:
 		x1, y1 = self.vertex_positions[u]
 		x2, y2 = self.vertex_positions[v]
-		line = self.canvas.create_line(x1, y1, x2, y2, fill=self.COLOR_EDGE, width=3)
+		line = self.canvas.create_line(x1, y1, x2, y2, fill=self.COLOR_EDGE, width=3, tags=(self.TAG_EDGE,))
 		mx, my = (x1 + x2) / 2, (y1 + y2) / 2
 		text = self.canvas.create_text(mx, my - 10, text=str(w), fill=self.COLOR_TEXT, font=("Segoe UI", 9))
 		self.edges.append((u, v, w))
-		key = (min(u, v), max(u, v))
+		key = _edge_key(u, v)
 		self.edge_items[key] = (line, text)
 
 	def find_vertex_at(self, x: float, y: float) -> Optional[VertexId]:
-		for vid, (vx, vy) in self.vertex_positions.items():
-			if (vx - x) ** 2 + (vy - y) ** 2 <= self.RADIUS ** 2:
-				return vid
-		return None
+		# A hit lies within RADIUS of the click, which spans at most 2x2 grid cells
+		r = self.RADIUS
+		found: Optional[VertexId] = None
+		for gx in range(int((x - r) // self.GRID_CELL), int((x + r) // self.GRID_CELL) + 1):
+			for gy in range(int((y - r) // self.GRID_CELL), int((y + r) // self.GRID_CELL) + 1):
+				for vid in self.grid.get((gx, gy), ()):
+					vx, vy = self.vertex_positions[vid]
+					if (vx - x) ** 2 + (vy - y) ** 2 <= r ** 2 and (found is None or vid < found):
+						found = vid
+		return found
 
 	def reset_colors(self) -> None:
-		for key, (line, _) in self.edge_items.items():
-			self.canvas.itemconfig(line, fill=self.COLOR_EDGE)
-		for vid, (oval, _) in self.vertex_items.items():
-			self.canvas.itemconfig(oval, fill=self.COLOR_NODE_IDLE)
+		self.canvas.itemconfig(self.TAG_EDGE, fill=self.COLOR_EDGE)
+		self.canvas.itemconfig(self.TAG_VERTEX, fill=self.COLOR_NODE_IDLE)
 		self.status_var.set("Colors reset. Ready.")
 
 	def run_visualizations(self) -> None:
@@ -208,10 +430,8 @@ class MSTVisualizer:
 		else:
 			self.status_var.set("Kruskal done. Running Prim visualization...")
 		# Reset edge colors, keep MST from Kruskal not highlighted
-		for key, (line, _) in self.edge_items.items():
-			self.canvas.itemconfig(line, fill=self.COLOR_EDGE)
-		for vid, (oval, _) in self.vertex_items.items():
-			self.canvas.itemconfig(oval, fill=self.COLOR_NODE_IDLE)
+		self.canvas.itemconfig(self.TAG_EDGE, fill=self.COLOR_EDGE)
+		self.canvas.itemconfig(self.TAG_VERTEX, fill=self.COLOR_NODE_IDLE)
 		self.animate_prim(on_complete=self.finish_animation)
 
 	def finish_animation(self) -> None:
@@ -227,51 +447,53 @@ class MSTVisualizer:
 
 	def animate_kruskal(self, on_complete) -> None:
 		n = self.total_vertices
-		dsu = DisjointSet(n)
-		sorted_edges = sorted(self.edges, key=lambda e: e[2])
-		mst_edges: List[Edge] = []
-
-		steps: List[Tuple[str, Tuple[VertexId, VertexId, float]]] = []
-		for (u, v, w) in sorted_edges:
-			steps.append(("consider", (u, v, w)))
-			if dsu.union(u, v):
-				mst_edges.append((u, v, w))
-				steps.append(("accept", (u, v, w)))
+		sorted_edges = sorted(self.edges, key=itemgetter(2))
+		keep, total_weight = kruskal_core(n, sorted_edges)
+
+		steps: List[Step] = []
+		# Steps share the sorted edge tuples rather than copying them, and
+		# carry the canvas line so playback needs no key lookups
+		for edge, kept in zip(sorted_edges, keep):
+			line, _ = self.edge_items[_edge_key(edge[0], edge[1])]
+			steps.append((CONSIDER, edge, line))
+			if kept:
+				steps.append((ACCEPT, edge, line))
 			else:
-				steps.append(("reject", (u, v, w)))
-
-		current_total: float = 0.0
-		def do_step(i: int) -> None:
-			if i >= len(steps):
-				# Finalize MST edges as green
-				for (u, v, w) in mst_edges:
-					key = (min(u, v), max(u, v))
-					line, _ = self.edge_items[key]
-					self.canvas.itemconfig(line, fill=self.COLOR_EDGE_MST)
-				# Compute and show total weight for Kruskal
-				total = sum(w for (_, _, w) in mst_edges)
-				self.kruskal_total_weight = total
-				self.status_var.set(f"Kruskal completed. Total weight (green) = {total}")
-				self.root.after(800, on_complete)
-				return
-			action, (u, v, w) = steps[i]
-			key = (min(u, v), max(u, v))
-			line, _ = self.edge_items[key]
-			if action == "consider":
-				self.canvas.itemconfig(line, fill=self.COLOR_EDGE_CURRENT)
-				self.status_var.set(f"Kruskal: considering edge ({u},{v}) w={w}")
-				self.root.after(700, lambda: do_step(i + 1))
-			elif action == "accept":
-				self.canvas.itemconfig(line, fill=self.COLOR_EDGE_MST)
-				current_total += w
-				self.status_var.set(f"Kruskal: accepted edge ({u},{v}) | MST total (green) = {current_total}")
-				self.root.after(700, lambda: do_step(i + 1))
-			else:  # reject
-				self.canvas.itemconfig(line, fill=self.COLOR_EDGE_REJECT)
-				self.status_var.set(f"Kruskal: rejected edge ({u},{v})")
-				self.root.after(700, lambda: do_step(i + 1))
-
-		do_step(0)
+				steps.append((REJECT, edge, line))
+
+		# Accepted edges join TAG_MST so the finalize step is one recolor
+		self.canvas.dtag(self.TAG_MST, self.TAG_MST)
+
+		def finalize() -> None:
+			# Finalize MST edges as green
+			self.canvas.itemconfig(self.TAG_MST, fill=self.COLOR_EDGE_MST)
+			# Show total weight for Kruskal, accumulated by kruskal_core
+			self.kruskal_total_weight = total_weight
+			self.status_var.set(f"Kruskal completed. Total weight (green) = {total_weight}")
+			self.root.after(800, on_complete)
+
+		handlers = [None, self._kruskal_consider, self._kruskal_reject, self._kruskal_accept]
+		self.play_steps(steps, handlers, finalize)
+
+	def _kruskal_consider(self, data: Tuple, line: int) -> int:
+		u, v, w = data
+		self.canvas.itemconfig(line, fill=self.COLOR_EDGE_CURRENT)
+		self.status_var.set(f"Kruskal: considering edge ({u},{v}) w={w}")
+		return 700
+
+	def _kruskal_reject(self, data: Tuple, line: int) -> int:
+		u, v, _ = data
+		self.canvas.itemconfig(line, fill=self.COLOR_EDGE_REJECT)
+		self.status_var.set(f"Kruskal: rejected edge ({u},{v})")
+		return 700
+
+	def _kruskal_accept(self, data: Tuple, line: int) -> int:
+		u, v, w = data
+		self.canvas.itemconfig(line, fill=self.COLOR_EDGE_MST)
+		self.canvas.addtag_withtag(self.TAG_MST, line)
+		self._running_total += w
+		self.status_var.set(f"Kruskal: accepted edge ({u},{v}) | MST total (green) = {self._running_total}")
+		return 700
 
 	def animate_prim(self, on_complete) -> None:
 		start = self.prompt_start_vertex_cli()
@@ -281,82 +503,79 @@ class MSTVisualizer:
 			return
 		self.prim_start = start
 
-		n = self.total_vertices
-		adj: Dict[int, List[Tuple[float, int, int]]] = {i: [] for i in range(n)}
-		for (u, v, w) in self.edges:
-			adj[u].append((w, u, v))
-			adj[v].append((w, v, u))
-
-		visited: Set[int] = set()
-		heap: List[Tuple[float, int, int]] = []
-
-		def push_edges(u: int) -> None:
-			for (w, _, v) in adj[u]:
-				if v not in visited:
-					heapq.heappush(heap, (w, u, v))
-
-		order: List[Tuple[str, Tuple]] = []
-		total_weight: float = 0.0
-		# Start from start vertex
-		order.append(("visit", (start,)))
-		visited.add(start)
-		push_edges(start)
-		while heap and len(visited) < n:
-			w, u, v = heapq.heappop(heap)
-			order.append(("consider", (u, v, w)))
-			if v in visited:
-				order.append(("skip", (u, v, w)))
-				continue
-			order.append(("accept", (u, v, w)))
-			total_weight += w
-			visited.add(v)
-			order.append(("visit", (v,)))
-			push_edges(v)
+		order, total_weight = prim_trace(self.total_vertices, self.edges, start)
+		# Resolve each event's canvas item once, ahead of playback
+		steps: List[Step] = []
+		for action, data in order:
+			if action == VISIT:
+				item, _ = self.vertex_items[data[0]]
+			else:
+				item, _ = self.edge_items[_edge_key(data[0], data[1])]
+			steps.append((action, data, item))
 
 		# Reset for animation playthrough
-		for vid, (oval, _) in self.vertex_items.items():
-			self.canvas.itemconfig(oval, fill=self.COLOR_NODE_IDLE)
-		for key, (line, _) in self.edge_items.items():
-			self.canvas.itemconfig(line, fill=self.COLOR_EDGE)
-
-		def do_step(i: int) -> None:
-			if i >= len(order):
-				# Record and show total weight for Prim
-				self.prim_total_weight = total_weight
-				self.status_var.set(f"Prim completed. Total weight (green) = {total_weight}")
-				self.root.after(800, on_complete)
-				return
-			action, data = order[i]
-			if action == "visit":
-				(u,) = data
-				oval, _ = self.vertex_items[u]
-				self.canvas.itemconfig(oval, fill=self.COLOR_NODE)
-				self.status_var.set(f"Prim: visited {u}")
-				self.root.after(600, lambda: do_step(i + 1))
-			elif action == "consider":
-				u, v, w = data
-				key = (min(u, v), max(u, v))
-				line, _ = self.edge_items[key]
-				self.canvas.itemconfig(line, fill=self.COLOR_EDGE_CURRENT)
-				self.status_var.set(f"Prim: considering ({u},{v}) w={w}")
-				self.root.after(700, lambda: do_step(i + 1))
-			elif action == "skip":
-				u, v, w = data
-				key = (min(u, v), max(u, v))
-				line, _ = self.edge_items[key]
-				self.canvas.itemconfig(line, fill=self.COLOR_EDGE_REJECT)
-				self.status_var.set(f"Prim: rejected ({u},{v}) (forms cycle)")
-				self.root.after(700, lambda: do_step(i + 1))
-			elif action == "accept":
-				u, v, w = data
-				key = (min(u, v), max(u, v))
-				line, _ = self.edge_items[key]
-				self.canvas.itemconfig(line, fill=self.COLOR_EDGE_MST)
-				total_weight += w
-				self.status_var.set(f"Prim: accepted ({u},{v}) | MST total (green) = {total_weight}")
-				self.root.after(700, lambda: do_step(i + 1))
-
-		do_step(0)
+		self.canvas.itemconfig(self.TAG_VERTEX, fill=self.COLOR_NODE_IDLE)
+		self.canvas.itemconfig(self.TAG_EDGE, fill=self.COLOR_EDGE)
+
+		def finalize() -> None:
+			# Record and show total weight for Prim
+			self.prim_total_weight = total_weight
+			self.status_var.set(f"Prim completed. Total weight (green) = {total_weight}")
+			self.root.after(800, on_complete)
+
+		handlers = [self._prim_visit, self._prim_consider, self._prim_reject, self._prim_accept]
+		self.play_steps(steps, handlers, finalize)
+
+	def _prim_visit(self, data: Tuple, oval: int) -> int:
+		(u,) = data
+		self.canvas.itemconfig(oval, fill=self.COLOR_NODE)
+		self.status_var.set(f"Prim: visited {u}")
+		return 600
+
+	def _prim_consider(self, data: Tuple, line: int) -> int:
+		u, v, w = data
+		self.canvas.itemconfig(line, fill=self.COLOR_EDGE_CURRENT)
+		self.status_var.set(f"Prim: considering ({u},{v}) w={w}")
+		return 700
+
+	def _prim_reject(self, data: Tuple, line: int) -> int:
+		u, v, _ = data
+		self.canvas.itemconfig(line, fill=self.COLOR_EDGE_REJECT)
+		self.status_var.set(f"Prim: rejected ({u},{v}) (forms cycle)")
+		return 700
+
+	def _prim_accept(self, data: Tuple, line: int) -> int:
+		u, v, w = data
+		self.canvas.itemconfig(line, fill=self.COLOR_EDGE_MST)
+		self._running_total += w
+		self.status_var.set(f"Prim: accepted ({u},{v}) | MST total (green) = {self._running_total}")
+		return 700
+
+	def play_steps(
+		self,
+		steps: List[Step],
+		handlers: List[Optional[StepHandler]],
+		finalize: Callable[[], None],
+	) -> None:
+		# Replay precomputed steps from a single timer callback; handlers is
+		# indexed by event code and each returns the delay in ms before the
+		# next step
+		self._steps = steps
+		self._handlers = handlers
+		self._finalize = finalize
+		self._step_idx = 0
+		self._running_total = 0.0
+		self._tick()
+
+	def _tick(self) -> None:
+		i = self._step_idx
+		if i >= len(self._steps):
+			self._finalize()
+			return
+		self._step_idx = i + 1
+		act, data, item = self._steps[i]
+		delay = self._handlers[act](data, item)
+		self.root.after(delay, self._tick)
 
 	def prompt_start_vertex_cli(self) -> Optional[int]:
 		# Prompt in a blocking manner in a separate modal dialog informing user to check console